@@ -5,298 +5,356 @@ Demonstrates the Reports app functionality with sample LCA data
 
 import os
 import sys
-import django
 import json
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional, the binary copy is skipped without it
+    msgpack = None
+
+try:
+    import zstandard as zstd
+except ImportError:  # optional, the compressed copy is skipped without it
+    zstd = None
 
 # Setup Django environment
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'lca_tool.settings')
-django.setup()
 
-from reports.utils.pdf import generate_lca_pdf_report, generate_simple_pdf
-from reports.utils.excel import generate_lca_excel_report, generate_simple_excel
-from reports.utils.csv import generate_lca_csv_report
+logger = logging.getLogger(__name__)
 
-def create_sample_lca_data():
-    """Create comprehensive sample LCA data for testing"""
-    
-    sample_data = {
-        "inputs_used": {
-            "material": "aluminum",
-            "production_rate": 1000,  # tons
-            "energy_use": 5000,       # kWh
-            "water_use": 2500,        # liters
-            "transport_distance": 500, # km
-            "recycling_rate": 0.8,    # 80%
-            "renewable_energy_percent": 35.5,
-            "waste_generation": 150,   # tons
-            "process_temperature": 850 # °C
-        },
-        
-        "predicted_parameters": {
-            "emission_factor": 2.1,
-            "energy_intensity": 4.8,
-            "water_efficiency": 0.92,
-            "recovery_rate": 0.87
-        },
-        
-        "overall_assessment": {
-            "overall_score": 78.5,
-            "overall_rating": "Good",
-            "sustainability_index": 72.3,
-            "environmental_grade": "B+",
-            "improvement_potential": "Medium"
-        },
-        
-        "environmental_impact": {
-            "carbon_footprint_total": 2456.8,    # kg CO₂
-            "carbon_footprint_production": 1820.2,
-            "carbon_footprint_transport": 456.6,
-            "carbon_footprint_endoflife": 180.0,
-            "water_use_total": 3200,             # liters
-            "energy_consumption_total": 5200,    # kWh
-            "waste_generated": 145.5,            # kg
-            "air_pollution_score": 65.2,
-            "water_pollution_score": 72.8,
-            "soil_impact_score": 58.9,
-            "emission_breakdown": {
-                "production": 1820.2,
-                "transport": 456.6,
-                "processing": 180.0
-            }
+# Output locations, relative to where the script is run from
+CWD = Path.cwd()
+REPORTS_DIR = CWD / "sample_reports"
+
+# Characters that must not end up in report file names
+_SAFE_TRANS = str.maketrans({" ": "_", "/": "_", "\\": "_"})
+
+
+def setup_django():
+    """Load Django only when SAMPLE_REPORT_DJANGO=1 (the report utils work on plain dicts)"""
+    if os.environ.get("SAMPLE_REPORT_DJANGO") == "1":
+        import django
+        django.setup()
+
+
+def write_lines(lines):
+    """Write a batch of progress messages to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Static part of the sample data, built once at import time
+_SAMPLE_TEMPLATE = {
+    "inputs_used": {
+        "material": "aluminum",
+        "production_rate": 1000,  # tons
+        "energy_use": 5000,       # kWh
+        "water_use": 2500,        # liters
+        "transport_distance": 500, # km
+        "recycling_rate": 0.8,    # 80%
+        "renewable_energy_percent": 35.5,
+        "waste_generation": 150,   # tons
+        "process_temperature": 850 # °C
+    },
+
+    "predicted_parameters": {
+        "emission_factor": 2.1,
+        "energy_intensity": 4.8,
+        "water_efficiency": 0.92,
+        "recovery_rate": 0.87
+    },
+
+    "overall_assessment": {
+        "overall_score": 78.5,
+        "overall_rating": "Good",
+        "sustainability_index": 72.3,
+        "environmental_grade": "B+",
+        "improvement_potential": "Medium"
+    },
+
+    "environmental_impact": {
+        "carbon_footprint_total": 2456.8,    # kg CO₂
+        "carbon_footprint_production": 1820.2,
+        "carbon_footprint_transport": 456.6,
+        "carbon_footprint_endoflife": 180.0,
+        "water_use_total": 3200,             # liters
+        "energy_consumption_total": 5200,    # kWh
+        "waste_generated": 145.5,            # kg
+        "air_pollution_score": 65.2,
+        "water_pollution_score": 72.8,
+        "soil_impact_score": 58.9,
+        "emission_breakdown": {
+            "production": 1820.2,
+            "transport": 456.6,
+            "processing": 180.0
+        }
+    },
+
+    "circularity_metrics": {
+        "circularity_index": 72.3,
+        "overall_rating": "Good",
+        "recycling_score": 85.2,
+        "resource_efficiency": 68.5,
+        "material_recovery_rate": 82.1,
+        "waste_reduction_potential": 15.3,
+        "cmur_analysis": {
+            "cmur_percent": 78.5,
+            "performance_assessment": "Above Average",
+            "target_achievement": "Met",
+            "improvement_potential": "Low"
         },
-        
-        "circularity_metrics": {
-            "circularity_index": 72.3,
-            "overall_rating": "Good",
-            "recycling_score": 85.2,
-            "resource_efficiency": 68.5,
-            "material_recovery_rate": 82.1,
-            "waste_reduction_potential": 15.3,
-            "cmur_analysis": {
-                "cmur_percent": 78.5,
-                "performance_assessment": "Above Average",
-                "target_achievement": "Met",
-                "improvement_potential": "Low"
-            },
-            "waste_analysis": {
-                "waste_reduction_percent": 12.5,
-                "recycling_efficiency": 88.2,
-                "material_loops_closed": 3
-            }
+        "waste_analysis": {
+            "waste_reduction_percent": 12.5,
+            "recycling_efficiency": 88.2,
+            "material_loops_closed": 3
+        }
+    },
+
+    "energy_analysis": {
+        "energy_efficiency_percent": 75.2,
+        "material_efficiency_percent": 82.1,
+        "process_intensity": 5.2,           # kWh/ton
+        "energy_rating": "Good",
+        "renewable_integration": 35.5,      # %
+        "energy_recovery": 18.3,            # %
+        "thermal_efficiency": 68.9          # %
+    },
+
+    "transport_analysis": {
+        "current_transport_emissions": 456.6,  # kg CO₂
+        "recommended_mode": "Rail + Truck",
+        "potential_emission_savings": 125.4,   # kg CO₂
+        "transport_efficiency": 72.1,          # score
+        "distance_optimization": 8.5,          # % reduction possible
+        "mode_efficiency": {
+            "current": "Truck",
+            "recommended": "Rail + Truck",
+            "savings_percent": 27.5
+        }
+    },
+
+    "recommendations": [
+        {
+            "priority": "High",
+            "category": "Energy Efficiency",
+            "action": "Increase renewable energy usage from 35% to 50%",
+            "impact": "Reduce carbon footprint by 12-15%",
+            "implementation": "Install solar panels and purchase green energy certificates",
+            "cost_estimate": "Medium",
+            "timeframe": "6-12 months"
         },
-        
-        "energy_analysis": {
-            "energy_efficiency_percent": 75.2,
-            "material_efficiency_percent": 82.1,
-            "process_intensity": 5.2,           # kWh/ton
-            "energy_rating": "Good",
-            "renewable_integration": 35.5,      # %
-            "energy_recovery": 18.3,            # %
-            "thermal_efficiency": 68.9          # %
+        {
+            "priority": "Medium", 
+            "category": "Waste Reduction",
+            "action": "Implement advanced material recovery systems",
+            "impact": "Increase recycling rate from 80% to 90%",
+            "implementation": "Upgrade sorting and processing equipment",
+            "cost_estimate": "High",
+            "timeframe": "12-18 months"
         },
-        
-        "transport_analysis": {
-            "current_transport_emissions": 456.6,  # kg CO₂
-            "recommended_mode": "Rail + Truck",
-            "potential_emission_savings": 125.4,   # kg CO₂
-            "transport_efficiency": 72.1,          # score
-            "distance_optimization": 8.5,          # % reduction possible
-            "mode_efficiency": {
-                "current": "Truck",
-                "recommended": "Rail + Truck",
-                "savings_percent": 27.5
-            }
+        {
+            "priority": "Medium",
+            "category": "Transport Optimization",
+            "action": "Switch from 100% truck to 70% rail + 30% truck transport",
+            "impact": "Reduce transport emissions by 27%",
+            "implementation": "Negotiate contracts with rail transport providers",
+            "cost_estimate": "Low",
+            "timeframe": "3-6 months"
         },
-        
-        "recommendations": [
-            {
-                "priority": "High",
-                "category": "Energy Efficiency",
-                "action": "Increase renewable energy usage from 35% to 50%",
-                "impact": "Reduce carbon footprint by 12-15%",
-                "implementation": "Install solar panels and purchase green energy certificates",
-                "cost_estimate": "Medium",
-                "timeframe": "6-12 months"
-            },
-            {
-                "priority": "Medium", 
-                "category": "Waste Reduction",
-                "action": "Implement advanced material recovery systems",
-                "impact": "Increase recycling rate from 80% to 90%",
-                "implementation": "Upgrade sorting and processing equipment",
-                "cost_estimate": "High",
-                "timeframe": "12-18 months"
-            },
-            {
-                "priority": "Medium",
-                "category": "Transport Optimization",
-                "action": "Switch from 100% truck to 70% rail + 30% truck transport",
-                "impact": "Reduce transport emissions by 27%",
-                "implementation": "Negotiate contracts with rail transport providers",
-                "cost_estimate": "Low",
-                "timeframe": "3-6 months"
-            },
-            {
-                "priority": "Low",
-                "category": "Process Optimization",
-                "action": "Optimize process temperature to reduce energy consumption",
-                "impact": "Improve energy efficiency by 5-8%",
-                "implementation": "Process engineering optimization and equipment upgrade",
-                "cost_estimate": "Medium",
-                "timeframe": "9-15 months"
-            }
+        {
+            "priority": "Low",
+            "category": "Process Optimization",
+            "action": "Optimize process temperature to reduce energy consumption",
+            "impact": "Improve energy efficiency by 5-8%",
+            "implementation": "Process engineering optimization and equipment upgrade",
+            "cost_estimate": "Medium",
+            "timeframe": "9-15 months"
+        }
+    ],
+
+    "calculation_metadata": {
+        "engine_version": "2.1.5",
+        "calculation_timestamp": None,  # filled in per call
+        "models_loaded": [
+            "environmental_model_20250919",
+            "circularity_model_20250919", 
+            "classification_model_20250919"
         ],
-        
+        "data_quality_score": 87.3,
+        "confidence_level": 0.89,
+        "validation_status": "Passed"
+    }
+}
+
+
+def create_sample_lca_data():
+    """Create comprehensive sample LCA data for testing"""
+    
+    # Only calculation_metadata is rebuilt; other nested values are shared
+    # with the template and must not be mutated
+    return {
+        **_SAMPLE_TEMPLATE,
         "calculation_metadata": {
-            "engine_version": "2.1.5",
+            **_SAMPLE_TEMPLATE["calculation_metadata"],
             "calculation_timestamp": datetime.now().isoformat(),
-            "models_loaded": [
-                "environmental_model_20250919",
-                "circularity_model_20250919", 
-                "classification_model_20250919"
-            ],
-            "data_quality_score": 87.3,
-            "confidence_level": 0.89,
-            "validation_status": "Passed"
-        }
+        },
     }
-    
-    return sample_data
 
 
-def generate_sample_reports():
+def generate_sample_reports(sample_lca_data=None):
     """Generate sample reports in all formats"""
     
-    print("🔄 Creating sample LCA data...")
-    sample_lca_data = create_sample_lca_data()
+    setup_django()
+    from reports.utils.pdf import generate_lca_pdf_report, generate_simple_pdf
+    from reports.utils.excel import generate_lca_excel_report, generate_simple_excel
+    from reports.utils.csv import generate_lca_csv_report
+    
+    output = []
+    if sample_lca_data is None:
+        output.append("🔄 Creating sample LCA data...")
+        sample_lca_data = create_sample_lca_data()
     
     project_name = "Sample Aluminum Production LCA"
-    print(f"📊 Generating reports for: {project_name}")
+    output.append(f"📊 Generating reports for: {project_name}")
     
     # Create reports directory in current project
-    reports_dir = os.path.join(os.getcwd(), "sample_reports")
-    os.makedirs(reports_dir, exist_ok=True)
-    print(f"📁 Reports will be saved in: {reports_dir}")
+    reports_dir = REPORTS_DIR
+    reports_dir.mkdir(exist_ok=True)
+    output.append(f"📁 Reports will be saved in: {reports_dir}")
     
     reports_generated = []
     
-    try:
-        # Generate PDF Report
-        print("\n📄 Generating PDF report...")
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        pdf_filename = f"LCA_Report_{project_name.replace(' ', '_')}_{timestamp}.pdf"
-        pdf_path = os.path.join(reports_dir, pdf_filename)
-        
-        pdf_path = generate_lca_pdf_report(
-            project_name=project_name,
-            lca_results=sample_lca_data,
-            output_path=pdf_path
-        )
-        reports_generated.append(("PDF", pdf_path))
-        print(f"✅ PDF report generated: {pdf_path}")
-        
-    except Exception as e:
-        print(f"❌ Error generating PDF report: {e}")
+    # Compute once so every report from this run shares the same timestamp
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    safe_name = project_name.translate(_SAFE_TRANS)
     
-    try:
-        # Generate Excel Report
-        print("\n📊 Generating Excel report...")
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        excel_filename = f"LCA_Report_{project_name.replace(' ', '_')}_{timestamp}.xlsx"
-        excel_path = os.path.join(reports_dir, excel_filename)
-        
-        excel_path = generate_lca_excel_report(
-            project_name=project_name,
-            lca_results=sample_lca_data,
-            output_path=excel_path
-        )
-        reports_generated.append(("Excel", excel_path))
-        print(f"✅ Excel report generated: {excel_path}")
-        
-    except Exception as e:
-        print(f"❌ Error generating Excel report: {e}")
+    simple_data = {"test_param": "test_value", "score": 85.5}
     
-    try:
-        # Generate CSV Reports (all types)
-        csv_types = ["comprehensive", "summary", "detailed"]
-        
-        for csv_type in csv_types:
-            print(f"\n📋 Generating {csv_type} CSV report...")
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            csv_filename = f"LCA_Report_{project_name.replace(' ', '_')}_{csv_type}_{timestamp}.csv"
-            csv_path = os.path.join(reports_dir, csv_filename)
-            
-            csv_path = generate_lca_csv_report(
-                project_name=project_name,
-                lca_results=sample_lca_data,
-                output_path=csv_path,
-                report_type=csv_type
-            )
-            reports_generated.append((f"CSV ({csv_type})", csv_path))
-            print(f"✅ {csv_type.title()} CSV report generated: {csv_path}")
-            
-    except Exception as e:
-        print(f"❌ Error generating CSV reports: {e}")
+    # (label, description, generator, kwargs) - each report is independent
+    tasks = [
+        ("PDF", "PDF report", generate_lca_pdf_report, {
+            "project_name": project_name,
+            "lca_results": sample_lca_data,
+            "output_path": str(reports_dir / f"LCA_Report_{safe_name}_{timestamp}.pdf"),
+        }),
+        ("Excel", "Excel report", generate_lca_excel_report, {
+            "project_name": project_name,
+            "lca_results": sample_lca_data,
+            "output_path": str(reports_dir / f"LCA_Report_{safe_name}_{timestamp}.xlsx"),
+        }),
+    ]
     
-    # Generate simple test reports
-    try:
-        print("\n🧪 Generating simple test reports...")
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        simple_pdf_path = os.path.join(reports_dir, f"Simple_PDF_Test_{timestamp}.pdf")
-        simple_pdf = generate_simple_pdf(
-            project_name="Simple Test Project",
-            data={"test_param": "test_value", "score": 85.5},
-            output_path=simple_pdf_path
-        )
-        reports_generated.append(("Simple PDF", simple_pdf))
-        print(f"✅ Simple PDF generated: {simple_pdf}")
-        
-        simple_excel_path = os.path.join(reports_dir, f"Simple_Excel_Test_{timestamp}.xlsx")
-        simple_excel = generate_simple_excel(
-            project_name="Simple Test Project", 
-            data={"test_param": "test_value", "score": 85.5},
-            output_path=simple_excel_path
-        )
-        reports_generated.append(("Simple Excel", simple_excel))
-        print(f"✅ Simple Excel generated: {simple_excel}")
+    # CSV Reports (all types)
+    for csv_type in ["comprehensive", "summary", "detailed"]:
+        tasks.append((f"CSV ({csv_type})", f"{csv_type.title()} CSV report", generate_lca_csv_report, {
+            "project_name": project_name,
+            "lca_results": sample_lca_data,
+            "output_path": str(reports_dir / f"LCA_Report_{safe_name}_{csv_type}_{timestamp}.csv"),
+            "report_type": csv_type,
+        }))
+    
+    # Simple test reports
+    tasks.append(("Simple PDF", "Simple PDF", generate_simple_pdf, {
+        "project_name": "Simple Test Project",
+        "data": simple_data,
+        "output_path": str(reports_dir / f"Simple_PDF_Test_{timestamp}.pdf"),
+    }))
+    tasks.append(("Simple Excel", "Simple Excel", generate_simple_excel, {
+        "project_name": "Simple Test Project",
+        "data": simple_data,
+        "output_path": str(reports_dir / f"Simple_Excel_Test_{timestamp}.xlsx"),
+    }))
+    
+    # PDF rendering and XLSX compression are CPU-bound, so build all
+    # formats in worker processes. "spawn" keeps behaviour identical on Windows.
+    output.append(f"\n⚙️ Generating {len(tasks)} reports in parallel...")
+    write_lines(output)
+    
+    output = []
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(4, len(tasks)), mp_context=mp_context,
+                             initializer=setup_django) as pool:
+        futures = [
+            (label, description, pool.submit(generator, **kwargs))
+            for label, description, generator, kwargs in tasks
+        ]
         
-    except Exception as e:
-        print(f"❌ Error generating simple reports: {e}")
+        for label, description, future in futures:
+            try:
+                report_path = future.result()
+                reports_generated.append((label, report_path))
+                output.append(f"✅ {description} generated: {report_path}")
+            except Exception as e:
+                output.append(f"❌ Error generating {description}: {e}")
     
     # Summary
-    print(f"\n🎉 Report Generation Complete!")
-    print(f"📈 Total reports generated: {len(reports_generated)}")
-    print("\n📋 Generated Reports:")
-    print("=" * 80)
+    output.append(f"\n🎉 Report Generation Complete!")
+    output.append(f"📈 Total reports generated: {len(reports_generated)}")
+    output.append("\n📋 Generated Reports:")
+    output.append("=" * 80)
+    
+    # One directory scan instead of a stat() call per generated file
+    with os.scandir(reports_dir) as entries:
+        file_sizes = {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
     
     for report_type, file_path in reports_generated:
-        file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+        file_size = file_sizes.get(os.path.basename(file_path), 0)
         file_size_mb = file_size / (1024 * 1024)
-        relative_path = os.path.relpath(file_path, os.getcwd())
-        print(f"{report_type:20} | {file_size_mb:.2f} MB | {relative_path}")
+        relative_path = os.path.relpath(file_path, CWD)
+        output.append(f"{report_type:20} | {file_size_mb:.2f} MB | {relative_path}")
     
-    print(f"\n💡 All reports saved in: {reports_dir}")
-    print("💡 Use these reports to test the download functionality via the API")
+    output.append(f"\n💡 All reports saved in: {reports_dir}")
+    output.append("💡 Use these reports to test the download functionality via the API")
+    write_lines(output)
     
     return reports_generated
 
 
-def save_sample_data():
+def save_sample_data(sample_data=None):
     """Save sample LCA data to JSON file for API testing"""
     
-    sample_data = create_sample_lca_data()
+    if sample_data is None:
+        sample_data = create_sample_lca_data()
     
     # Save to file for API testing in current directory
-    output_file = os.path.join(os.getcwd(), "sample_lca_data.json")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(sample_data, f, indent=2, ensure_ascii=False)
+    output_file = CWD / "sample_lca_data.json"
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(sample_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(sample_data, f, indent=2, ensure_ascii=False)
     
-    relative_path = os.path.relpath(output_file, os.getcwd())
-    print(f"\n💾 Sample LCA data saved to: {relative_path}")
-    print("💡 Use this JSON file to test the Reports API endpoints")
+    relative_path = output_file.relative_to(CWD)
+    output = [f"\n💾 Sample LCA data saved to: {relative_path}"]
+    
+    # Compact binary copy for API testers that can read MessagePack
+    if msgpack is not None:
+        msgpack_file = output_file.with_suffix('.msgpack')
+        msgpack_file.write_bytes(msgpack.packb(sample_data, use_bin_type=True))
+        output.append(f"💾 Binary copy saved to: {msgpack_file.relative_to(CWD)}")
+    
+    # Compressed compact JSON for shipping the sample data across the network
+    if zstd is not None:
+        if orjson is not None:
+            compact_json = orjson.dumps(sample_data, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            compact_json = json.dumps(sample_data, ensure_ascii=False).encode('utf-8')
+        zst_file = output_file.with_name(output_file.name + '.zst')
+        zst_file.write_bytes(zstd.ZstdCompressor(level=3).compress(compact_json))
+        output.append(f"💾 Compressed copy saved to: {zst_file.relative_to(CWD)}")
+    output.append("💡 Use this JSON file to test the Reports API endpoints")
+    write_lines(output)
     
     return output_file
 
@@ -304,32 +362,38 @@ def save_sample_data():
 def main():
     """Main function to run sample report generation"""
     
-    print("🚀 LCA Reports Sample Generator")
-    print("=" * 50)
+    write_lines([
+        "🚀 LCA Reports Sample Generator",
+        "=" * 50,
+        "🔄 Creating sample LCA data...",
+    ])
     
     try:
+        # Build the sample data once so the saved JSON matches the reports
+        sample_lca_data = create_sample_lca_data()
+        
         # Generate sample reports
-        reports = generate_sample_reports()
+        reports = generate_sample_reports(sample_lca_data)
         
         # Save sample data for API testing
-        json_file = save_sample_data()
-        
-        print(f"\n🎯 Sample Generation Summary:")
-        print(f"   ✅ {len(reports)} reports generated successfully")
-        print(f"   ✅ Sample data saved to {json_file}")
-        print(f"   ✅ Ready for API testing!")
+        json_file = save_sample_data(sample_lca_data)
         
-        print(f"\n📖 Next Steps:")
-        print(f"   1. Test the generated reports by opening them")
-        print(f"   2. Use the Reports API with the sample JSON data")
-        print(f"   3. Test download functionality via the API endpoints")
+        write_lines([
+            "\n🎯 Sample Generation Summary:",
+            f"   ✅ {len(reports)} reports generated successfully",
+            f"   ✅ Sample data saved to {json_file}",
+            "   ✅ Ready for API testing!",
+            "\n📖 Next Steps:",
+            "   1. Test the generated reports by opening them",
+            "   2. Use the Reports API with the sample JSON data",
+            "   3. Test download functionality via the API endpoints",
+        ])
         
         return True
         
     except Exception as e:
         print(f"\n❌ Error during sample generation: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Sample generation failed")
         return False
 
 
@@ -3,220 +3,248 @@ r_zero Integration Test - Comprehensive testing of gap filling functionality
 """
 
 import json
+import sys
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 
 
+# Default for optional results that may legitimately be None
+_UNSET = object()
+
+
 class RZeroAPITester:
     def __init__(self, base_url="http://localhost:8000"):
         self.base_url = base_url
         self.session = requests.Session()
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        })
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount('http://', adapter)
+    
+    @contextmanager
+    def _output(self):
+        """Yield a list for this test's lines and print them together at the
+        end, so tests run side by side in run_complete_test stay readable"""
+        lines = []
+        try:
+            yield lines
+        finally:
+            sys.stdout.write("\n".join(lines) + "\n")
         
     def test_health_check(self):
         """Test r_zero service health"""
-        print("🏥 Testing r_zero Health Check...")
-        try:
-            response = self.session.get(f"{self.base_url}/api/r-zero/health/")
-            print(f"Status: {response.status_code}")
-            if response.status_code == 200:
-                data = response.json()
-                print(f"✅ Service Status: {data.get('status')}")
-                print(f"📊 Total Gaps Tracked: {data.get('total_gaps_tracked', 0)}")
-                return True
-            else:
-                print(f"❌ Health check failed: {response.text}")
+        with self._output() as out:
+            out.append("\n🏥 Testing r_zero Health Check...")
+            try:
+                response = self.session.get(f"{self.base_url}/api/r-zero/health/")
+                out.append(f"Status: {response.status_code}")
+                if response.status_code == 200:
+                    data = response.json()
+                    out.append(f"✅ Service Status: {data.get('status')}")
+                    out.append(f"📊 Total Gaps Tracked: {data.get('total_gaps_tracked', 0)}")
+                    return True
+                else:
+                    out.append(f"❌ Health check failed: {response.text}")
+                    return False
+            except Exception as e:
+                out.append(f"❌ Health check error: {str(e)}")
                 return False
-        except Exception as e:
-            print(f"❌ Health check error: {str(e)}")
-            return False
     
     def test_fill_missing_data_aluminum(self):
         """Test gap filling for aluminum with minimal data"""
-        print("\n🔍 Testing Gap Filling - Aluminum (Minimal Data)...")
+        with self._output() as out:
+            out.append("\n🔍 Testing Gap Filling - Aluminum (Minimal Data)...")
         
-        test_data = {
-            "project_name": "Aluminum LCA Test - Minimal",
-            "input_data": {
-                "material": "aluminum",
-                "production_rate": 150
-            },
-            "material_type": "aluminum",
-            "confidence_threshold": 0.6
-        }
+            test_data = {
+                "project_name": "Aluminum LCA Test - Minimal",
+                "input_data": {
+                    "material": "aluminum",
+                    "production_rate": 150
+                },
+                "material_type": "aluminum",
+                "confidence_threshold": 0.6
+            }
         
-        try:
-            response = self.session.post(
-                f"{self.base_url}/api/r-zero/fill-missing-data/",
-                json=test_data,
-                headers={'Content-Type': 'application/json'}
-            )
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/api/r-zero/fill-missing-data/",
+                    json=test_data
+                )
             
-            print(f"Status: {response.status_code}")
-            if response.status_code == 200:
-                result = response.json()
-                print("✅ Gap filling successful!")
+                out.append(f"Status: {response.status_code}")
+                if response.status_code == 200:
+                    result = response.json()
+                    out.append("✅ Gap filling successful!")
                 
-                # Display results
-                print(f"📥 Original Data: {result['original_data']}")
-                print(f"📤 Filled Data: {result['filled_data']}")
-                print(f"🔧 Gaps Filled: {result['gaps_filled']}")
-                print(f"🎯 Confidence Scores: {result['confidence_scores']}")
-                print(f"💡 Recommendations: {result['recommendations']}")
+                    # Display results
+                    out.append(f"📥 Original Data: {result['original_data']}")
+                    out.append(f"📤 Filled Data: {result['filled_data']}")
+                    out.append(f"🔧 Gaps Filled: {result['gaps_filled']}")
+                    out.append(f"🎯 Confidence Scores: {result['confidence_scores']}")
+                    out.append(f"💡 Recommendations: {result['recommendations']}")
                 
-                return result
-            else:
-                print(f"❌ Gap filling failed: {response.text}")
-                return None
+                    return result
+                else:
+                    out.append(f"❌ Gap filling failed: {response.text}")
+                    return None
                 
-        except Exception as e:
-            print(f"❌ Gap filling error: {str(e)}")
-            return None
+            except Exception as e:
+                out.append(f"❌ Gap filling error: {str(e)}")
+                return None
     
     def test_fill_missing_data_copper(self):
         """Test gap filling for copper with partial data"""
-        print("\n🔍 Testing Gap Filling - Copper (Partial Data)...")
+        with self._output() as out:
+            out.append("\n🔍 Testing Gap Filling - Copper (Partial Data)...")
         
-        test_data = {
-            "project_name": "Copper LCA Test - Partial",
-            "input_data": {
-                "material": "copper",
-                "production_rate": 200,
-                "energy_use": 1800,
-                "is_recycled": True
-            },
-            "material_type": "copper",
-            "confidence_threshold": 0.7
-        }
+            test_data = {
+                "project_name": "Copper LCA Test - Partial",
+                "input_data": {
+                    "material": "copper",
+                    "production_rate": 200,
+                    "energy_use": 1800,
+                    "is_recycled": True
+                },
+                "material_type": "copper",
+                "confidence_threshold": 0.7
+            }
         
-        try:
-            response = self.session.post(
-                f"{self.base_url}/api/r-zero/fill-missing-data/",
-                json=test_data,
-                headers={'Content-Type': 'application/json'}
-            )
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/api/r-zero/fill-missing-data/",
+                    json=test_data
+                )
             
-            print(f"Status: {response.status_code}")
-            if response.status_code == 200:
-                result = response.json()
-                print("✅ Gap filling successful!")
+                out.append(f"Status: {response.status_code}")
+                if response.status_code == 200:
+                    result = response.json()
+                    out.append("✅ Gap filling successful!")
                 
-                print(f"📥 Original Data: {result['original_data']}")
-                print(f"📤 Filled Data: {result['filled_data']}")
-                print(f"🔧 Gaps Filled: {result['gaps_filled']}")
-                print(f"🎯 Confidence Scores: {result['confidence_scores']}")
+                    out.append(f"📥 Original Data: {result['original_data']}")
+                    out.append(f"📤 Filled Data: {result['filled_data']}")
+                    out.append(f"🔧 Gaps Filled: {result['gaps_filled']}")
+                    out.append(f"🎯 Confidence Scores: {result['confidence_scores']}")
                 
-                return result
-            else:
-                print(f"❌ Gap filling failed: {response.text}")
-                return None
+                    return result
+                else:
+                    out.append(f"❌ Gap filling failed: {response.text}")
+                    return None
                 
-        except Exception as e:
-            print(f"❌ Gap filling error: {str(e)}")
-            return None
+            except Exception as e:
+                out.append(f"❌ Gap filling error: {str(e)}")
+                return None
     
     def test_list_data_gaps(self):
         """Test listing all data gaps"""
-        print("\n📋 Testing Data Gaps List...")
+        with self._output() as out:
+            out.append("\n📋 Testing Data Gaps List...")
         
-        try:
-            response = self.session.get(f"{self.base_url}/api/r-zero/gaps/")
-            print(f"Status: {response.status_code}")
+            try:
+                response = self.session.get(f"{self.base_url}/api/r-zero/gaps/")
+                out.append(f"Status: {response.status_code}")
             
-            if response.status_code == 200:
-                gaps = response.json()
-                print(f"✅ Found {len(gaps)} data gaps")
+                if response.status_code == 200:
+                    gaps = response.json()
+                    out.append(f"✅ Found {len(gaps)} data gaps")
                 
-                for gap in gaps[:3]:  # Show first 3
-                    print(f"  📊 {gap['project_name']} - {gap['field_name']}: "
-                          f"{gap['predicted_value']} (confidence: {gap['confidence_score']})")
+                    for gap in gaps[:3]:  # Show first 3
+                        out.append(f"  📊 {gap['project_name']} - {gap['field_name']}: "
+                              f"{gap['predicted_value']} (confidence: {gap['confidence_score']})")
                 
-                return gaps
-            else:
-                print(f"❌ Failed to list gaps: {response.text}")
-                return []
+                    return gaps
+                else:
+                    out.append(f"❌ Failed to list gaps: {response.text}")
+                    return []
                 
-        except Exception as e:
-            print(f"❌ List gaps error: {str(e)}")
-            return []
+            except Exception as e:
+                out.append(f"❌ List gaps error: {str(e)}")
+                return []
     
     def test_gap_statistics(self):
         """Test gap statistics endpoint"""
-        print("\n📈 Testing Gap Statistics...")
+        with self._output() as out:
+            out.append("\n📈 Testing Gap Statistics...")
         
-        try:
-            response = self.session.get(f"{self.base_url}/api/r-zero/statistics/")
-            print(f"Status: {response.status_code}")
+            try:
+                response = self.session.get(f"{self.base_url}/api/r-zero/statistics/")
+                out.append(f"Status: {response.status_code}")
             
-            if response.status_code == 200:
-                stats = response.json()['statistics']
-                print("✅ Statistics retrieved!")
-                print(f"  📊 Total Gaps: {stats['total_gaps']}")
-                print(f"  ✅ Confirmed Gaps: {stats['confirmed_gaps']}")
-                print(f"  ⏳ Pending Gaps: {stats['pending_gaps']}")
-                print(f"  📈 Confirmation Rate: {stats['confirmation_rate']:.1f}%")
+                if response.status_code == 200:
+                    stats = response.json()['statistics']
+                    out.append("✅ Statistics retrieved!")
+                    out.append(f"  📊 Total Gaps: {stats['total_gaps']}")
+                    out.append(f"  ✅ Confirmed Gaps: {stats['confirmed_gaps']}")
+                    out.append(f"  ⏳ Pending Gaps: {stats['pending_gaps']}")
+                    out.append(f"  📈 Confirmation Rate: {stats['confirmation_rate']:.1f}%")
                 
-                if stats['field_performance']:
-                    print("  🎯 Field Performance:")
-                    for field in stats['field_performance'][:3]:
-                        print(f"    - {field['field_name']}: {field['avg_confidence']:.2f} confidence")
+                    if stats['field_performance']:
+                        out.append("  🎯 Field Performance:")
+                        for field in stats['field_performance'][:3]:
+                            out.append(f"    - {field['field_name']}: {field['avg_confidence']:.2f} confidence")
                 
-                return stats
-            else:
-                print(f"❌ Statistics failed: {response.text}")
-                return None
+                    return stats
+                else:
+                    out.append(f"❌ Statistics failed: {response.text}")
+                    return None
                 
-        except Exception as e:
-            print(f"❌ Statistics error: {str(e)}")
-            return None
+            except Exception as e:
+                out.append(f"❌ Statistics error: {str(e)}")
+                return None
     
-    def test_integration_with_ai_models(self):
+    def test_integration_with_ai_models(self, gap_result=_UNSET):
         """Test integration with existing AI models"""
-        print("\n🤝 Testing Integration with AI Models...")
+        with self._output() as out:
+            out.append("\n🤝 Testing Integration with AI Models...")
         
-        # First, fill gaps with r_zero
-        gap_result = self.test_fill_missing_data_aluminum()
-        if not gap_result:
-            print("❌ Cannot test integration - gap filling failed")
-            return False
+            # First, fill gaps with r_zero (unless a previous fill result was passed in)
+            if gap_result is _UNSET:
+                gap_result = self.test_fill_missing_data_aluminum()
+            if not gap_result:
+                out.append("❌ Cannot test integration - gap filling failed")
+                return False
         
-        # Use filled data with AI models endpoint
-        filled_data = gap_result['filled_data']
-        ai_models_data = {
-            "environmental_metrics": {
-                "energy_use": filled_data.get("energy_use"),
-                "water_use": filled_data.get("water_use"),
-                "transport_distance": filled_data.get("transport_distance")
-            },
-            "process_features": {
-                "recycling_rate": filled_data.get("recycling_rate"),
-                "renewable_energy_percent": filled_data.get("renewable_energy_percent"),
-                "production_rate": filled_data.get("production_rate")
+            # Use filled data with AI models endpoint
+            filled_data = gap_result['filled_data']
+            ai_models_data = {
+                "environmental_metrics": {
+                    "energy_use": filled_data.get("energy_use"),
+                    "water_use": filled_data.get("water_use"),
+                    "transport_distance": filled_data.get("transport_distance")
+                },
+                "process_features": {
+                    "recycling_rate": filled_data.get("recycling_rate"),
+                    "renewable_energy_percent": filled_data.get("renewable_energy_percent"),
+                    "production_rate": filled_data.get("production_rate")
+                }
             }
-        }
         
-        try:
-            response = self.session.post(
-                f"{self.base_url}/api/ai-models/aluminum/predict/",
-                json=ai_models_data,
-                headers={'Content-Type': 'application/json'}
-            )
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/api/ai-models/aluminum/predict/",
+                    json=ai_models_data
+                )
             
-            print(f"AI Models Status: {response.status_code}")
-            if response.status_code == 200:
-                result = response.json()
-                print("✅ Integration successful!")
-                print(f"🔗 r_zero gaps → AI Models prediction completed")
-                print(f"📊 LCA Analysis: {result.get('message', 'Success')}")
-                return True
-            else:
-                print(f"⚠️ AI Models response: {response.status_code}")
-                print("🔗 Integration partially successful (r_zero works independently)")
-                return True
+                out.append(f"AI Models Status: {response.status_code}")
+                if response.status_code == 200:
+                    result = response.json()
+                    out.append("✅ Integration successful!")
+                    out.append(f"🔗 r_zero gaps → AI Models prediction completed")
+                    out.append(f"📊 LCA Analysis: {result.get('message', 'Success')}")
+                    return True
+                else:
+                    out.append(f"⚠️ AI Models response: {response.status_code}")
+                    out.append("🔗 Integration partially successful (r_zero works independently)")
+                    return True
                 
-        except Exception as e:
-            print(f"⚠️ AI Models integration note: {str(e)}")
-            print("🔗 r_zero works independently - integration can be added later")
-            return True
+            except Exception as e:
+                out.append(f"⚠️ AI Models integration note: {str(e)}")
+                out.append("🔗 r_zero works independently - integration can be added later")
+                return True
     
     def run_complete_test(self):
         """Run complete r_zero functionality test"""
@@ -225,23 +253,25 @@ class RZeroAPITester:
         
         results = {}
         
-        # Test 1: Health Check
-        results['health'] = self.test_health_check()
-        
-        # Test 2: Gap Filling - Aluminum
-        results['aluminum_fill'] = self.test_fill_missing_data_aluminum() is not None
-        
-        # Test 3: Gap Filling - Copper  
-        results['copper_fill'] = self.test_fill_missing_data_copper() is not None
-        
-        # Test 4: List Gaps
-        results['list_gaps'] = len(self.test_list_data_gaps()) >= 0
-        
-        # Test 5: Statistics
-        results['statistics'] = self.test_gap_statistics() is not None
-        
-        # Test 6: Integration
-        results['integration'] = self.test_integration_with_ai_models()
+        # Tests 1-5 are independent HTTP round-trips, so run them concurrently
+        # over the shared session instead of paying each request's latency in turn
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            health = pool.submit(self.test_health_check)
+            aluminum_fill = pool.submit(self.test_fill_missing_data_aluminum)
+            copper_fill = pool.submit(self.test_fill_missing_data_copper)
+            list_gaps = pool.submit(self.test_list_data_gaps)
+            statistics = pool.submit(self.test_gap_statistics)
+            
+            # Test 6 only depends on the aluminum fill, so reuse its result
+            aluminum_result = aluminum_fill.result()
+            integration = pool.submit(self.test_integration_with_ai_models, aluminum_result)
+            
+            results['health'] = health.result()
+            results['aluminum_fill'] = aluminum_result is not None
+            results['copper_fill'] = copper_fill.result() is not None
+            results['list_gaps'] = len(list_gaps.result()) >= 0
+            results['statistics'] = statistics.result() is not None
+            results['integration'] = integration.result()
         
         # Summary
         print("\n" + "=" * 60)
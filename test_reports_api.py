@@ -4,21 +4,89 @@ Demonstrates how to use the Reports API endpoints with sample data
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib parser
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional, only the JSON file is read without it
+    msgpack = None
+
+try:
+    import zstandard as zstd
+except ImportError:  # optional, the compressed copy is ignored without it
+    zstd = None
 
 # API Configuration
 BASE_URL = "http://localhost:8000/api"
 REPORTS_API = f"{BASE_URL}/reports"
 
+# Written by generate_sample_reports.py
+SAMPLE_DATA_FILE = 'sample_lca_data.json'
+SAMPLE_DATA_MSGPACK_FILE = 'sample_lca_data.msgpack'
+SAMPLE_DATA_ZST_FILE = 'sample_lca_data.json.zst'
+
+# One pooled session for every test, so calls reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+SESSION.headers.update({"Content-Type": "application/json"})
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+@lru_cache(maxsize=None)
+def _read_sample_bytes(path):
+    """Raw bytes of a sample data file, read from disk once per run"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _msgpack_copy_is_current():
+    """True when the MessagePack copy is at least as new as the JSON file,
+    which stays the source of truth and may have been edited by hand"""
+    try:
+        msgpack_mtime = os.path.getmtime(SAMPLE_DATA_MSGPACK_FILE)
+    except OSError:
+        return False
+    try:
+        return msgpack_mtime >= os.path.getmtime(SAMPLE_DATA_FILE)
+    except OSError:
+        return True  # No JSON file, the binary copy is all there is
+
+
 def load_sample_data():
-    """Load sample LCA data from JSON file"""
+    """Load sample LCA data, preferring an up-to-date MessagePack copy"""
+    
+    if msgpack is not None and _msgpack_copy_is_current():
+        try:
+            return msgpack.unpackb(_read_sample_bytes(SAMPLE_DATA_MSGPACK_FILE), raw=False)
+        except ValueError:
+            pass  # Unreadable binary copy, fall back to the JSON file
     
     try:
-        with open('sample_lca_data.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _json_loads(_read_sample_bytes(SAMPLE_DATA_FILE))
     except FileNotFoundError:
+        # Only the compressed copy was shipped, decompress it transparently
+        if zstd is not None and os.path.exists(SAMPLE_DATA_ZST_FILE):
+            raw = _read_sample_bytes(SAMPLE_DATA_ZST_FILE)
+            return _json_loads(zstd.ZstdDecompressor().decompress(raw))
         print("❌ Sample LCA data file not found. Run generate_sample_reports.py first.")
         return None
     except json.JSONDecodeError as e:
@@ -26,6 +94,43 @@ def load_sample_data():
         return None
 
 
+@contextmanager
+def _output():
+    """Buffer one report test's messages and print them as a block once it
+    finishes, since main() runs all six tests in a thread pool"""
+    lines = []
+    try:
+        yield lines
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _call(out, method, path, label, *, json=None, expect=201, timeout=30):
+    """Send one Reports API request, recording the outcome and timing in `out`.
+    Returns the decoded response body, or None on failure."""
+    
+    start = time.perf_counter()
+    try:
+        response = SESSION.request(method, f"{REPORTS_API}{path}", json=json, timeout=timeout)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        if response.status_code != expect:
+            out.append(f"❌ {label} failed: {response.status_code}")
+            out.append(f"   Error: {response.text}")
+            return None
+        
+        result = response.json()
+        out.append(f"✅ {label} succeeded in {elapsed_ms:.0f} ms")
+        return result
+        
+    except requests.exceptions.ConnectionError:
+        out.append("❌ Connection error. Make sure Django server is running on localhost:8000")
+        return None
+    except Exception as e:
+        out.append(f"❌ Error: {e}")
+        return None
+
+
 def get_auth_token():
     """Get authentication token (you'll need to implement this based on your auth system)"""
     
@@ -41,277 +146,149 @@ def get_auth_token():
     return token if token else "your-jwt-token-here"
 
 
-def test_generate_pdf_report(sample_data, auth_token):
+def test_generate_pdf_report(sample_data):
     """Test PDF report generation"""
     
-    print("\n📄 Testing PDF Report Generation...")
-    
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "lca_results": sample_data,
-        "format": "pdf",
-        "project_name": "Test PDF Report via API",
-        "options": {
-            "include_charts": True,
-            "include_recommendations": True
+    with _output() as out:
+        out.append("\n📄 Testing PDF Report Generation...")
+    
+        payload = {
+            "lca_results": sample_data,
+            "format": "pdf",
+            "project_name": "Test PDF Report via API",
+            "options": {
+                "include_charts": True,
+                "include_recommendations": True
+            }
         }
-    }
     
-    try:
-        response = requests.post(f"{REPORTS_API}/generate/", 
-                               json=payload, 
-                               headers=headers,
-                               timeout=30)
-        
-        if response.status_code == 201:
-            result = response.json()
-            print(f"✅ PDF report generated successfully!")
-            print(f"   Report ID: {result.get('report_id')}")
-            print(f"   Download URL: {result.get('download_url')}")
-            print(f"   File Size: {result.get('file_size')} bytes")
-            return result
-        else:
-            print(f"❌ PDF generation failed: {response.status_code}")
-            print(f"   Error: {response.text}")
-            return None
-            
-    except requests.exceptions.ConnectionError:
-        print("❌ Connection error. Make sure Django server is running on localhost:8000")
-        return None
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return None
+        result = _call(out, "POST", "/generate/", "PDF generation", json=payload)
+        if result:
+            out.append(f"   Report ID: {result.get('report_id')}")
+            out.append(f"   Download URL: {result.get('download_url')}")
+            out.append(f"   File Size: {result.get('file_size')} bytes")
+        return result
 
 
-def test_generate_excel_report(sample_data, auth_token):
+def test_generate_excel_report(sample_data):
     """Test Excel report generation"""
     
-    print("\n📊 Testing Excel Report Generation...")
-    
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "lca_results": sample_data,
-        "format": "excel",
-        "project_name": "Test Excel Report via API",
-        "options": {
-            "include_charts": True,
-            "include_recommendations": True
+    with _output() as out:
+        out.append("\n📊 Testing Excel Report Generation...")
+    
+        payload = {
+            "lca_results": sample_data,
+            "format": "excel",
+            "project_name": "Test Excel Report via API",
+            "options": {
+                "include_charts": True,
+                "include_recommendations": True
+            }
         }
-    }
     
-    try:
-        response = requests.post(f"{REPORTS_API}/generate/", 
-                               json=payload, 
-                               headers=headers,
-                               timeout=30)
-        
-        if response.status_code == 201:
-            result = response.json()
-            print(f"✅ Excel report generated successfully!")
-            print(f"   Report ID: {result.get('report_id')}")
-            print(f"   Download URL: {result.get('download_url')}")
-            print(f"   File Size: {result.get('file_size')} bytes")
-            return result
-        else:
-            print(f"❌ Excel generation failed: {response.status_code}")
-            print(f"   Error: {response.text}")
-            return None
-            
-    except requests.exceptions.ConnectionError:
-        print("❌ Connection error. Make sure Django server is running on localhost:8000")
-        return None
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return None
+        result = _call(out, "POST", "/generate/", "Excel generation", json=payload)
+        if result:
+            out.append(f"   Report ID: {result.get('report_id')}")
+            out.append(f"   Download URL: {result.get('download_url')}")
+            out.append(f"   File Size: {result.get('file_size')} bytes")
+        return result
 
 
-def test_generate_csv_report(sample_data, auth_token):
+def test_generate_csv_report(sample_data):
     """Test CSV report generation"""
     
-    print("\n📋 Testing CSV Report Generation...")
+    with _output() as out:
+        out.append("\n📋 Testing CSV Report Generation...")
     
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "lca_results": sample_data,
-        "format": "csv",
-        "project_name": "Test CSV Report via API",
-        "options": {
-            "csv_type": "comprehensive"
+        payload = {
+            "lca_results": sample_data,
+            "format": "csv",
+            "project_name": "Test CSV Report via API",
+            "options": {
+                "csv_type": "comprehensive"
+            }
         }
-    }
     
-    try:
-        response = requests.post(f"{REPORTS_API}/generate/", 
-                               json=payload, 
-                               headers=headers,
-                               timeout=30)
-        
-        if response.status_code == 201:
-            result = response.json()
-            print(f"✅ CSV report generated successfully!")
-            print(f"   Report ID: {result.get('report_id')}")
-            print(f"   Download URL: {result.get('download_url')}")
-            print(f"   File Size: {result.get('file_size')} bytes")
-            return result
-        else:
-            print(f"❌ CSV generation failed: {response.status_code}")
-            print(f"   Error: {response.text}")
-            return None
-            
-    except requests.exceptions.ConnectionError:
-        print("❌ Connection error. Make sure Django server is running on localhost:8000")
-        return None
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return None
+        result = _call(out, "POST", "/generate/", "CSV generation", json=payload)
+        if result:
+            out.append(f"   Report ID: {result.get('report_id')}")
+            out.append(f"   Download URL: {result.get('download_url')}")
+            out.append(f"   File Size: {result.get('file_size')} bytes")
+        return result
 
 
-def test_comparative_report(sample_data, auth_token):
+def test_comparative_report(sample_data):
     """Test comparative report generation"""
     
-    print("\n🔄 Testing Comparative Report Generation...")
-    
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json"
-    }
-    
-    # Create variations of the sample data for comparison
-    project_a = sample_data.copy()
-    project_b = sample_data.copy()
-    project_c = sample_data.copy()
-    
-    # Modify some values for comparison
-    project_b['overall_assessment']['overall_score'] = 85.2
-    project_b['environmental_impact']['carbon_footprint_total'] = 2100.5
-    
-    project_c['overall_assessment']['overall_score'] = 65.8
-    project_c['environmental_impact']['carbon_footprint_total'] = 2800.3
+    with _output() as out:
+        out.append("\n🔄 Testing Comparative Report Generation...")
+    
+        # Create variations of the sample data for comparison. Only the
+        # modified sections are copied, so sample_data itself (shared with
+        # the other tests) is never mutated.
+        project_a = sample_data
+        project_b = {
+            **sample_data,
+            'overall_assessment': {**sample_data['overall_assessment'], 'overall_score': 85.2},
+            'environmental_impact': {**sample_data['environmental_impact'], 'carbon_footprint_total': 2100.5}
+        }
+        project_c = {
+            **sample_data,
+            'overall_assessment': {**sample_data['overall_assessment'], 'overall_score': 65.8},
+            'environmental_impact': {**sample_data['environmental_impact'], 'carbon_footprint_total': 2800.3}
+        }
     
-    payload = {
-        "projects_data": {
-            "Aluminum Project A": project_a,
-            "Aluminum Project B": project_b,
-            "Aluminum Project C": project_c
-        },
-        "format": "excel",
-        "report_title": "LCA Comparative Analysis - Test Projects",
-        "options": {}
-    }
+        payload = {
+            "projects_data": {
+                "Aluminum Project A": project_a,
+                "Aluminum Project B": project_b,
+                "Aluminum Project C": project_c
+            },
+            "format": "excel",
+            "report_title": "LCA Comparative Analysis - Test Projects",
+            "options": {}
+        }
     
-    try:
-        response = requests.post(f"{REPORTS_API}/generate/comparative/", 
-                               json=payload, 
-                               headers=headers,
-                               timeout=30)
-        
-        if response.status_code == 201:
-            result = response.json()
-            print(f"✅ Comparative report generated successfully!")
-            print(f"   Report ID: {result.get('report_id')}")
-            print(f"   Download URL: {result.get('download_url')}")
-            print(f"   Projects Compared: {result.get('projects_compared')}")
-            return result
-        else:
-            print(f"❌ Comparative report generation failed: {response.status_code}")
-            print(f"   Error: {response.text}")
-            return None
-            
-    except requests.exceptions.ConnectionError:
-        print("❌ Connection error. Make sure Django server is running on localhost:8000")
-        return None
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return None
+        result = _call(out, "POST", "/generate/comparative/", "Comparative report generation", json=payload)
+        if result:
+            out.append(f"   Report ID: {result.get('report_id')}")
+            out.append(f"   Download URL: {result.get('download_url')}")
+            out.append(f"   Projects Compared: {result.get('projects_compared')}")
+        return result
 
 
-def test_reports_summary(auth_token):
+def test_reports_summary():
     """Test user reports summary endpoint"""
     
-    print("\n📈 Testing Reports Summary...")
-    
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json"
-    }
+    with _output() as out:
+        out.append("\n📈 Testing Reports Summary...")
     
-    try:
-        response = requests.get(f"{REPORTS_API}/summary/", 
-                              headers=headers,
-                              timeout=10)
-        
-        if response.status_code == 200:
-            result = response.json()
-            print(f"✅ Reports summary retrieved successfully!")
-            print(f"   Total Reports: {result.get('total_reports')}")
-            print(f"   By Format: {result.get('by_format')}")
-            print(f"   Total Downloads: {result.get('total_downloads')}")
-            print(f"   Total File Size: {result.get('total_file_size_mb')} MB")
-            return result
-        else:
-            print(f"❌ Summary retrieval failed: {response.status_code}")
-            print(f"   Error: {response.text}")
-            return None
-            
-    except requests.exceptions.ConnectionError:
-        print("❌ Connection error. Make sure Django server is running on localhost:8000")
-        return None
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return None
+        result = _call(out, "GET", "/summary/", "Summary retrieval", expect=200, timeout=10)
+        if result:
+            out.append(f"   Total Reports: {result.get('total_reports')}")
+            out.append(f"   By Format: {result.get('by_format')}")
+            out.append(f"   Total Downloads: {result.get('total_downloads')}")
+            out.append(f"   Total File Size: {result.get('total_file_size_mb')} MB")
+        return result
 
 
-def test_preview_data(sample_data, auth_token):
+def test_preview_data(sample_data):
     """Test report data preview endpoint"""
     
-    print("\n👁️ Testing Report Data Preview...")
+    with _output() as out:
+        out.append("\n👁️ Testing Report Data Preview...")
     
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "lca_results": sample_data
-    }
+        payload = {
+            "lca_results": sample_data
+        }
     
-    try:
-        response = requests.post(f"{REPORTS_API}/preview/", 
-                               json=payload, 
-                               headers=headers,
-                               timeout=10)
-        
-        if response.status_code == 200:
-            result = response.json()
-            print(f"✅ Preview data retrieved successfully!")
-            print(f"   Project Info: {result.get('project_info')}")
-            print(f"   Key Metrics: {result.get('key_metrics')}")
-            print(f"   Data Sections: {len(result.get('data_sections', []))}")
-            print(f"   Recommendations: {result.get('recommendations_count')}")
-            return result
-        else:
-            print(f"❌ Preview failed: {response.status_code}")
-            print(f"   Error: {response.text}")
-            return None
-            
-    except requests.exceptions.ConnectionError:
-        print("❌ Connection error. Make sure Django server is running on localhost:8000")
-        return None
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return None
+        result = _call(out, "POST", "/preview/", "Preview", json=payload, expect=200, timeout=10)
+        if result:
+            out.append(f"   Project Info: {result.get('project_info')}")
+            out.append(f"   Key Metrics: {result.get('key_metrics')}")
+            out.append(f"   Data Sections: {len(result.get('data_sections', []))}")
+            out.append(f"   Recommendations: {result.get('recommendations_count')}")
+        return result
 
 
 def main():
@@ -330,34 +307,23 @@ def main():
     
     # Get authentication token
     auth_token = get_auth_token()
-    
-    # Test results tracking
-    tests_passed = 0
-    total_tests = 6
-    
-    # Test 1: Preview data
-    if test_preview_data(sample_data, auth_token):
-        tests_passed += 1
-    
-    # Test 2: Generate PDF report
-    if test_generate_pdf_report(sample_data, auth_token):
-        tests_passed += 1
-    
-    # Test 3: Generate Excel report
-    if test_generate_excel_report(sample_data, auth_token):
-        tests_passed += 1
-    
-    # Test 4: Generate CSV report
-    if test_generate_csv_report(sample_data, auth_token):
-        tests_passed += 1
-    
-    # Test 5: Generate comparative report
-    if test_comparative_report(sample_data, auth_token):
-        tests_passed += 1
-    
-    # Test 6: Get reports summary
-    if test_reports_summary(auth_token):
-        tests_passed += 1
+    SESSION.headers["Authorization"] = f"Bearer {auth_token}"
+    
+    # The six API calls are independent, so run them concurrently instead of
+    # paying each report generation round-trip in turn
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        futures = [
+            pool.submit(test_preview_data, sample_data),           # Test 1
+            pool.submit(test_generate_pdf_report, sample_data),    # Test 2
+            pool.submit(test_generate_excel_report, sample_data),  # Test 3
+            pool.submit(test_generate_csv_report, sample_data),    # Test 4
+            pool.submit(test_comparative_report, sample_data),     # Test 5
+            pool.submit(test_reports_summary),                     # Test 6
+        ]
+        
+        # Test results tracking
+        total_tests = len(futures)
+        tests_passed = sum(1 for future in futures if future.result())
     
     # Summary
     print(f"\n🎯 Test Results Summary:")
@@ -16,9 +16,16 @@ class CustomUserAdmin(UserAdmin):
     # Fields to search in the admin search box
     search_fields = ('username', 'email', 'first_name', 'last_name')
     
-    # Order by username
+    # Order by username (backed by its unique index)
     ordering = ('username',)
     
+    # Bounded page size, and skip the unfiltered COUNT(*) on large tables
+    list_per_page = 50
+    show_full_result_count = False
+    
+    # Render audit fields as plain text instead of form widgets
+    readonly_fields = ('date_joined', 'last_login', 'created_at', 'updated_at')
+    
     # Fields to show when editing a user
     fieldsets = UserAdmin.fieldsets + (
         ('Role Information', {'fields': ('role',)}),
@@ -1,31 +1,57 @@
 """
 Role-based decorators and mixins for LCA Tool
 """
+import logging
 from functools import wraps
 from django.http import JsonResponse
-from django.contrib.auth.decorators import login_required
+from django.contrib.auth.views import redirect_to_login
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework import mixins, viewsets
 
+from .models import ADMIN, ENGINEER, METALLURGIST
+from .permissions import (
+    ADMIN_ROLES,
+    ALL_ROLES,
+    METALLURGIST_OR_ADMIN_ROLES,
+    ROLE_HIERARCHY,
+    _FusedPermission,
+    compile_permissions,
+)
+
+
+_perm_logger = logging.getLogger('permissions')
+
+
+def _authentication_required(request):
+    """
+    Response for unauthenticated requests: browsers are redirected to the
+    login page, API clients get a JSON 401.
+    """
+    if 'text/html' in request.META.get('HTTP_ACCEPT', ''):
+        return redirect_to_login(request.get_full_path())
+    return JsonResponse({'error': 'Authentication required'}, status=401)
+
 
 def role_required(*roles):
     """
     Decorator to require specific roles for function-based views.
     Usage: @role_required('admin', 'metallurgist')
     """
+    roles_set = frozenset(roles)
+
     def decorator(view_func):
         @wraps(view_func)
-        @login_required
         def _wrapped_view(request, *args, **kwargs):
-            if not request.user.is_authenticated:
-                return JsonResponse({'error': 'Authentication required'}, status=401)
+            user = request.user
+            if not user.is_authenticated:
+                return _authentication_required(request)
             
-            if request.user.role not in roles:
+            if user.role not in roles_set:
                 return JsonResponse({
                     'error': 'Insufficient permissions',
                     'required_roles': roles,
-                    'user_role': request.user.role
+                    'user_role': user.role
                 }, status=403)
             
             return view_func(request, *args, **kwargs)
@@ -38,22 +64,20 @@ def minimum_role_required(minimum_role):
     Decorator to require minimum role level.
     Usage: @minimum_role_required('metallurgist')
     """
+    required_level = ROLE_HIERARCHY.get(minimum_role, 0)
+
     def decorator(view_func):
         @wraps(view_func)
-        @login_required
         def _wrapped_view(request, *args, **kwargs):
-            if not request.user.is_authenticated:
-                return JsonResponse({'error': 'Authentication required'}, status=401)
-            
-            from .permissions import ROLE_HIERARCHY
-            user_level = ROLE_HIERARCHY.get(request.user.role, 0)
-            required_level = ROLE_HIERARCHY.get(minimum_role, 0)
+            user = request.user
+            if not user.is_authenticated:
+                return _authentication_required(request)
             
-            if user_level < required_level:
+            if ROLE_HIERARCHY.get(user.role, 0) < required_level:
                 return JsonResponse({
                     'error': 'Insufficient role level',
                     'minimum_role': minimum_role,
-                    'user_role': request.user.role
+                    'user_role': user.role
                 }, status=403)
             
             return view_func(request, *args, **kwargs)
@@ -66,7 +90,7 @@ def admin_required(view_func):
     Decorator to require admin role.
     Usage: @admin_required
     """
-    return role_required('admin')(view_func)
+    return role_required(ADMIN)(view_func)
 
 
 def metallurgist_or_admin_required(view_func):
@@ -74,7 +98,7 @@ def metallurgist_or_admin_required(view_func):
     Decorator to require metallurgist or admin role.
     Usage: @metallurgist_or_admin_required
     """
-    return role_required('metallurgist', 'admin')(view_func)
+    return role_required(METALLURGIST, ADMIN)(view_func)
 
 
 class RoleBasedViewMixin:
@@ -83,27 +107,48 @@ class RoleBasedViewMixin:
     """
     required_roles = None
     minimum_role = None
+    _required_roles_set = None
+    _required_level = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve role requirements once per view class
+        if cls.required_roles:
+            cls._required_roles_set = frozenset(cls.required_roles)
+        else:
+            cls._required_roles_set = None
+        if cls.minimum_role:
+            cls._required_level = ROLE_HIERARCHY.get(cls.minimum_role, 0)
+        else:
+            cls._required_level = None
     
     def dispatch(self, request, *args, **kwargs):
         if not request.user.is_authenticated:
             return Response({'error': 'Authentication required'}, 
                           status=status.HTTP_401_UNAUTHORIZED)
         
-        # Check required roles
-        if self.required_roles and request.user.role not in self.required_roles:
+        # Check required roles; an as_view(required_roles=...) override is
+        # not precomputed, so build its set here
+        required_roles_set = self._required_roles_set
+        if 'required_roles' in self.__dict__:
+            required_roles_set = (frozenset(self.required_roles)
+                                  if self.required_roles else None)
+        if (required_roles_set is not None
+                and request.user.role not in required_roles_set):
             return Response({
                 'error': 'Insufficient permissions',
                 'required_roles': self.required_roles,
                 'user_role': request.user.role
             }, status=status.HTTP_403_FORBIDDEN)
         
-        # Check minimum role
-        if self.minimum_role:
-            from .permissions import ROLE_HIERARCHY
-            user_level = ROLE_HIERARCHY.get(request.user.role, 0)
-            required_level = ROLE_HIERARCHY.get(self.minimum_role, 0)
-            
-            if user_level < required_level:
+        # Check minimum role; an as_view(minimum_role=...) override is not
+        # precomputed, so resolve it here
+        required_level = self._required_level
+        if 'minimum_role' in self.__dict__:
+            required_level = (ROLE_HIERARCHY.get(self.minimum_role, 0)
+                              if self.minimum_role else None)
+        if required_level is not None:
+            if ROLE_HIERARCHY.get(request.user.role, 0) < required_level:
                 return Response({
                     'error': 'Insufficient role level',
                     'minimum_role': self.minimum_role,
@@ -117,35 +162,63 @@ class AdminOnlyMixin(RoleBasedViewMixin):
     """
     Mixin to restrict access to admin users only.
     """
-    required_roles = ['admin']
+    required_roles = [ADMIN]
 
 
 class MetallurgistOrAdminMixin(RoleBasedViewMixin):
     """
     Mixin to restrict access to metallurgist and admin users.
     """
-    required_roles = ['metallurgist', 'admin']
+    required_roles = [METALLURGIST, ADMIN]
 
 
 class AuthenticatedUserMixin(RoleBasedViewMixin):
     """
     Mixin to allow all authenticated users.
     """
-    required_roles = ['engineer', 'metallurgist', 'admin']
+    required_roles = [ENGINEER, METALLURGIST, ADMIN]
+
+
+class FusedPermissionMixin:
+    """
+    Mixin that compiles permission_classes once per view class and checks
+    them through a single fused permission per request.
+    """
+    _compiled_permissions = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compiled_permissions = compile_permissions(cls.permission_classes)
+    
+    def get_permissions(self):
+        # permission_classes overridden through as_view() are not precompiled
+        if 'permission_classes' in self.__dict__:
+            return super().get_permissions()
+        return [_FusedPermission(self._compiled_permissions)]
 
 
-class RoleBasedModelViewSet(viewsets.ModelViewSet):
+class RoleBasedModelViewSet(FusedPermissionMixin, viewsets.ModelViewSet):
     """
     Custom ModelViewSet with role-based permissions for different actions.
     """
     role_permissions = {
-        'list': ['engineer', 'metallurgist', 'admin'],
-        'retrieve': ['engineer', 'metallurgist', 'admin'],
-        'create': ['metallurgist', 'admin'],
-        'update': ['metallurgist', 'admin'],
-        'partial_update': ['metallurgist', 'admin'],
-        'destroy': ['admin'],
+        'list': ALL_ROLES,
+        'retrieve': ALL_ROLES,
+        'create': METALLURGIST_OR_ADMIN_ROLES,
+        'update': METALLURGIST_OR_ADMIN_ROLES,
+        'partial_update': METALLURGIST_OR_ADMIN_ROLES,
+        'destroy': ADMIN_ROLES,
     }
+    # (role, action) -> allowed; each subclass gets its own cache
+    _decision_cache = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.role_permissions = {
+            action: frozenset(roles)
+            for action, roles in cls.role_permissions.items()
+        }
+        cls._decision_cache = {}
     
     def check_permissions(self, request):
         """
@@ -157,33 +230,46 @@ class RoleBasedModelViewSet(viewsets.ModelViewSet):
             self.permission_denied(request, message='Authentication required')
         
         action = self.action or 'list'
-        required_roles = self.role_permissions.get(action, ['admin'])
+        key = (request.user.role, action)
+        allowed = self._decision_cache.get(key)
+        if allowed is None:
+            allowed = key[0] in self.role_permissions.get(action, ADMIN_ROLES)
+            self._decision_cache[key] = allowed
         
-        if request.user.role not in required_roles:
+        if not allowed:
             self.permission_denied(
                 request, 
                 message=f'Role {request.user.role} not allowed for action {action}'
             )
 
 
+def _user_info(request):
+    user = getattr(request, 'user', None)
+    if user and user.is_authenticated:
+        return f"{user.username} ({user.role})"
+    return "Anonymous"
+
+
 def log_permission_check(func):
     """
     Decorator to log permission checks for auditing.
+    Works on function-based views and on view methods.
     """
     @wraps(func)
-    def wrapper(request, *args, **kwargs):
-        import logging
-        logger = logging.getLogger('permissions')
-        
-        user = getattr(request, 'user', None)
-        user_info = f"{user.username} ({user.role})" if user and user.is_authenticated else "Anonymous"
+    def wrapper(*args, **kwargs):
+        # (request, ...) for function views, (self, request, ...) for methods
+        request = args[0] if hasattr(args[0], 'META') else args[1]
         
-        logger.info(f"Permission check: {func.__name__} - User: {user_info} - Path: {request.path}")
+        if _perm_logger.isEnabledFor(logging.INFO):
+            _perm_logger.info("Permission check: %s - User: %s - Path: %s",
+                              func.__name__, _user_info(request), request.path)
         
-        result = func(request, *args, **kwargs)
+        result = func(*args, **kwargs)
         
-        if hasattr(result, 'status_code') and result.status_code == 403:
-            logger.warning(f"Permission denied: {func.__name__} - User: {user_info}")
+        if (getattr(result, 'status_code', None) == 403
+                and _perm_logger.isEnabledFor(logging.WARNING)):
+            _perm_logger.warning("Permission denied: %s - User: %s",
+                                 func.__name__, _user_info(request))
         
         return result
     return wrapper
@@ -195,6 +281,8 @@ class OwnershipMixin:
     Users can only access their own objects, admin can access all.
     """
     ownership_field = 'created_by'  # Field that stores the owner
+    # Optional column subset for .only(); must include ownership_field
+    ownership_only_fields = None
     
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -202,8 +290,13 @@ class OwnershipMixin:
         if not self.request.user.is_authenticated:
             return queryset.none()
         
+        # Fetch the owner in the same query instead of once per object
+        queryset = queryset.select_related(self.ownership_field)
+        if self.ownership_only_fields:
+            queryset = queryset.only(*self.ownership_only_fields)
+        
         # Admin can see all objects
-        if self.request.user.role == 'admin':
+        if self.request.user.role == ADMIN:
             return queryset
         
         # Users can only see their own objects
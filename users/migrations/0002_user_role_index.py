@@ -0,0 +1,18 @@
+# Generated by Django 4.2.24 on 2026-10-15 01:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('engineer', 'Engineer'), ('metallurgist', 'Metallurgist'), ('admin', 'Admin')], db_index=True, default='engineer', help_text='User role in the LCA system', max_length=20),
+        ),
+    ]
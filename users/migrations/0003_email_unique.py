@@ -0,0 +1,17 @@
+# Generated by Django 4.2.24 on 2026-10-15 01:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_role_index'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(condition=models.Q(('email', ''), _negated=True), fields=('email',), name='users_user_email_unique'),
+        ),
+    ]
@@ -1,37 +1,73 @@
+import sys
+
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
+
+# Interned role names; roles loaded from the database are interned too,
+# so comparisons against these constants hit the identity fast path
+ENGINEER = sys.intern('engineer')
+METALLURGIST = sys.intern('metallurgist')
+ADMIN = sys.intern('admin')
+
+# Role hierarchy for easy permission checking
+ROLE_HIERARCHY = {
+    ADMIN: 3,
+    METALLURGIST: 2,
+    ENGINEER: 1
+}
+
+
 class User(AbstractUser):
     """
     Custom User model extending AbstractUser with role-based access
     """
     ROLE_CHOICES = [
-        ('engineer', 'Engineer'),
-        ('metallurgist', 'Metallurgist'),
-        ('admin', 'Admin'),
+        (ENGINEER, 'Engineer'),
+        (METALLURGIST, 'Metallurgist'),
+        (ADMIN, 'Admin'),
     ]
     
     role = models.CharField(
         max_length=20,
         choices=ROLE_CHOICES,
-        default='engineer',
+        default=ENGINEER,
+        db_index=True,
         help_text='User role in the LCA system'
     )
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            # Email is optional, so only non-blank addresses must be unique
+            models.UniqueConstraint(
+                fields=['email'],
+                condition=~models.Q(email=''),
+                name='users_user_email_unique',
+            ),
+        ]
+    
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        role = instance.__dict__.get('role')
+        if role:
+            instance.role = sys.intern(role)
+        return instance
+    
     @property
     def is_engineer(self):
-        return self.role == 'engineer'
+        return self.role == ENGINEER
     
     @property
     def is_metallurgist(self):
-        return self.role == 'metallurgist'
+        return self.role == METALLURGIST
     
     @property
     def is_admin_role(self):
-        return self.role == 'admin'
+        return self.role == ADMIN
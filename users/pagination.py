@@ -0,0 +1,14 @@
+"""
+Pagination classes for LCA Tool user endpoints
+"""
+from rest_framework.pagination import CursorPagination
+
+
+class UserCursorPagination(CursorPagination):
+    """
+    Cursor pagination over users, newest first.
+    Keyset paging avoids OFFSET scans on large user tables.
+    """
+    page_size = 50
+    # id breaks ties between users that joined at the same instant
+    ordering = ('-date_joined', '-id')
@@ -3,6 +3,14 @@ Custom permission classes for role-based access control in LCA Tool
 """
 from rest_framework import permissions
 
+from .models import ADMIN, ENGINEER, METALLURGIST, ROLE_HIERARCHY
+
+
+# Role sets for O(1) membership checks
+ADMIN_ROLES = frozenset({ADMIN})
+METALLURGIST_OR_ADMIN_ROLES = frozenset({METALLURGIST, ADMIN})
+ALL_ROLES = frozenset({ENGINEER, METALLURGIST, ADMIN})
+
 
 class IsAdminRole(permissions.BasePermission):
     """
@@ -12,7 +20,7 @@ class IsAdminRole(permissions.BasePermission):
         return (
             request.user and 
             request.user.is_authenticated and 
-            request.user.role == 'admin'
+            request.user.role == ADMIN
         )
 
 
@@ -24,7 +32,7 @@ class IsMetallurgistOrAdmin(permissions.BasePermission):
         return (
             request.user and 
             request.user.is_authenticated and 
-            request.user.role in ['metallurgist', 'admin']
+            request.user.role in METALLURGIST_OR_ADMIN_ROLES
         )
 
 
@@ -36,7 +44,7 @@ class IsEngineerOrAbove(permissions.BasePermission):
         return (
             request.user and 
             request.user.is_authenticated and 
-            request.user.role in ['engineer', 'metallurgist', 'admin']
+            request.user.role in ALL_ROLES
         )
 
 
@@ -53,7 +61,7 @@ class CanUploadDatasets(permissions.BasePermission):
         return (
             request.user and 
             request.user.is_authenticated and 
-            request.user.role in ['metallurgist', 'admin']
+            request.user.role in METALLURGIST_OR_ADMIN_ROLES
         )
 
 
@@ -65,7 +73,7 @@ class CanRunLCA(permissions.BasePermission):
         return (
             request.user and 
             request.user.is_authenticated and 
-            request.user.role in ['engineer', 'metallurgist', 'admin']
+            request.user.role in ALL_ROLES
         )
 
 
@@ -82,7 +90,7 @@ class CanManageAIModels(permissions.BasePermission):
         return (
             request.user and 
             request.user.is_authenticated and 
-            request.user.role in ['metallurgist', 'admin']
+            request.user.role in METALLURGIST_OR_ADMIN_ROLES
         )
 
 
@@ -96,7 +104,7 @@ class CanViewReports(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         # Admin can access all reports
-        if request.user.role == 'admin':
+        if request.user.role == ADMIN:
             return True
         
         # Users can only access their own reports
@@ -116,10 +124,18 @@ class CanManageUsers(permissions.BasePermission):
         return (
             request.user and 
             request.user.is_authenticated and 
-            request.user.role == 'admin'
+            request.user.role == ADMIN
         )
 
 
+class IsSelfOrAdmin(permissions.BasePermission):
+    """
+    Object permission: users may act on their own account, admin on any.
+    """
+    def has_object_permission(self, request, view, obj):
+        return obj == request.user or request.user.role == ADMIN
+
+
 class RoleBasedPermission(permissions.BasePermission):
     """
     Generic role-based permission class.
@@ -129,22 +145,19 @@ class RoleBasedPermission(permissions.BasePermission):
         if not (request.user and request.user.is_authenticated):
             return False
         
-        # Get required roles from the view
-        required_roles = getattr(view, 'required_roles', [])
+        # Get required roles from the view, preferring the precomputed set
+        # unless required_roles was overridden through as_view()
+        required_roles = None
+        if 'required_roles' not in view.__dict__:
+            required_roles = getattr(view, '_required_roles_set', None)
+        if required_roles is None:
+            required_roles = getattr(view, 'required_roles', [])
         if not required_roles:
             return True  # No specific role requirement
         
         return request.user.role in required_roles
 
 
-# Role hierarchy for easy permission checking
-ROLE_HIERARCHY = {
-    'admin': 3,
-    'metallurgist': 2, 
-    'engineer': 1
-}
-
-
 class MinimumRolePermission(permissions.BasePermission):
     """
     Permission based on minimum role level.
@@ -154,8 +167,52 @@ class MinimumRolePermission(permissions.BasePermission):
         if not (request.user and request.user.is_authenticated):
             return False
         
-        minimum_role = getattr(view, 'minimum_role', 'engineer')
-        user_role_level = ROLE_HIERARCHY.get(request.user.role, 0)
-        required_role_level = ROLE_HIERARCHY.get(minimum_role, 0)
+        # Views built on RoleBasedViewMixin carry a precomputed level, unless
+        # minimum_role was overridden through as_view()
+        required_role_level = None
+        if 'minimum_role' not in view.__dict__:
+            required_role_level = getattr(view, '_required_level', None)
+        if required_role_level is None:
+            minimum_role = getattr(view, 'minimum_role', ENGINEER)
+            required_role_level = ROLE_HIERARCHY.get(minimum_role, 0)
         
-        return user_role_level >= required_role_level
\ No newline at end of file
+        return ROLE_HIERARCHY.get(request.user.role, 0) >= required_role_level
+
+
+def compile_permissions(permission_classes):
+    """
+    Instantiate a view's permission classes once and return their bound
+    checks for _FusedPermission.
+    """
+    compiled = []
+    for permission_class in permission_classes:
+        permission = permission_class()
+        compiled.append((permission, permission.has_permission,
+                         permission.has_object_permission))
+    return tuple(compiled)
+
+
+class _FusedPermission(permissions.BasePermission):
+    """
+    Runs precompiled permission checks in a single call, stopping at the
+    first failure and exposing that permission's message and code.
+    """
+    def __init__(self, compiled):
+        self.compiled = compiled
+    
+    def _deny(self, permission):
+        self.message = getattr(permission, 'message', None)
+        self.code = getattr(permission, 'code', None)
+        return False
+    
+    def has_permission(self, request, view):
+        for permission, has_permission, _ in self.compiled:
+            if not has_permission(request, view):
+                return self._deny(permission)
+        return True
+    
+    def has_object_permission(self, request, view, obj):
+        for permission, _, has_object_permission in self.compiled:
+            if not has_object_permission(request, view, obj):
+                return self._deny(permission)
+        return True
@@ -1,76 +1,142 @@
+import copy
+from contextlib import contextmanager
+
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
-from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth import authenticate
 from .models import User
 
-# Get User model
-User = get_user_model()
+# Upper bound on submitted passwords, so oversized input is rejected before
+# it reaches the (deliberately slow) password hasher
+MAX_PASSWORD_LENGTH = 128
+
+# role -> display label, a dict lookup instead of get_role_display()'s
+# scan over the field choices
+ROLE_DISPLAY = dict(User.ROLE_CHOICES)
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer class's fields once and give each instance a fresh
+    copy, instead of re-running ModelSerializer field introspection.
+    """
+    def get_fields(self):
+        cls = type(self)
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
+
+
+# Name of the unique email constraint on User (see User.Meta)
+_EMAIL_CONSTRAINT = 'users_user_email_unique'
+
+
+def _is_email_conflict(exc):
+    """
+    True when an IntegrityError comes from the unique email constraint
+    """
+    # PostgreSQL drivers report the violated constraint by name
+    diag = getattr(exc.__cause__, 'diag', None)
+    constraint = getattr(diag, 'constraint_name', None)
+    if constraint is not None:
+        return constraint == _EMAIL_CONSTRAINT
+    # SQLite only names the column in its message
+    message = str(exc)
+    return _EMAIL_CONSTRAINT in message or 'users_user.email' in message
+
+
+@contextmanager
+def _unique_email():
+    """
+    Report a violation of the unique email constraint as a field error
+    """
+    try:
+        with transaction.atomic():
+            yield
+    except IntegrityError as exc:
+        if not _is_email_conflict(exc):
+            raise
+        raise serializers.ValidationError(
+            {'email': ["User with this email already exists."]}
+        )
+
+
+class UniqueEmailMixin:
+    """
+    Leave email uniqueness to the database constraint instead of a SELECT
+    per write. Serializers using this mixin should disable the generated
+    email UniqueValidator via extra_kwargs.
+    """
+    def save(self, **kwargs):
+        with _unique_email():
+            return super().save(**kwargs)
 
 
-class RegisterSerializer(serializers.ModelSerializer):
+class RegisterSerializer(UniqueEmailMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for user registration - matches specification
     """
-    password = serializers.CharField(write_only=True, required=True, validators=[validate_password])
-    password2 = serializers.CharField(write_only=True, required=True)
+    password = serializers.CharField(write_only=True, required=True, max_length=MAX_PASSWORD_LENGTH,
+                                     validators=[validate_password])
+    password2 = serializers.CharField(write_only=True, required=True, max_length=MAX_PASSWORD_LENGTH)
 
     class Meta:
         model = User
         fields = ('username', 'email', 'password', 'password2', 'role')
+        extra_kwargs = {'email': {'validators': []}}
 
     def validate(self, attrs):
-        if attrs['password'] != attrs['password2']:
+        # The confirmation is only compared, never stored
+        if attrs['password'] != attrs.pop('password2'):
             raise serializers.ValidationError({"password": "Passwords don't match."})
         return attrs
 
     def create(self, validated_data):
-        validated_data.pop('password2')
         user = User.objects.create_user(**validated_data)
         return user
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(UniqueEmailMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for user profile - matches specification
     """
     class Meta:
         model = User
         fields = ('id', 'username', 'email', 'role')
+        extra_kwargs = {'email': {'validators': []}}
 
 
 # Keep existing serializers for backward compatibility
-class UserRegistrationSerializer(serializers.ModelSerializer):
+class UserRegistrationSerializer(UniqueEmailMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for user registration
     """
     password = serializers.CharField(
         write_only=True,
         min_length=8,
+        max_length=MAX_PASSWORD_LENGTH,
         validators=[validate_password]
     )
-    password_confirm = serializers.CharField(write_only=True)
+    password_confirm = serializers.CharField(write_only=True, max_length=MAX_PASSWORD_LENGTH)
     
     class Meta:
         model = User
         fields = ('username', 'email', 'password', 'password_confirm', 
                  'first_name', 'last_name', 'role')
+        extra_kwargs = {'email': {'validators': []}}
         
     def validate(self, attrs):
-        if attrs['password'] != attrs['password_confirm']:
+        # The confirmation is only compared, never stored
+        if attrs['password'] != attrs.pop('password_confirm'):
             raise serializers.ValidationError(
                 {"password": "Password fields didn't match."}
             )
         return attrs
     
-    def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("User with this email already exists.")
-        return value
-    
     def create(self, validated_data):
-        # Remove password_confirm from validated_data
-        validated_data.pop('password_confirm', None)
-        
         # Create user with encrypted password
         user = User.objects.create_user(**validated_data)
         return user
@@ -81,14 +147,14 @@ class UserLoginSerializer(serializers.Serializer):
     Serializer for user login
     """
     username = serializers.CharField()
-    password = serializers.CharField(write_only=True)
+    password = serializers.CharField(write_only=True, max_length=MAX_PASSWORD_LENGTH)
     
     def validate(self, attrs):
         username = attrs.get('username')
         password = attrs.get('password')
         
         if username and password:
-            user = authenticate(username=username, password=password)
+            user = authenticate(self.context.get('request'), username=username, password=password)
             if not user:
                 raise serializers.ValidationError(
                     'Unable to log in with provided credentials.'
@@ -105,11 +171,11 @@ class UserLoginSerializer(serializers.Serializer):
             )
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for user profile information
     """
-    role_display = serializers.CharField(source='get_role_display', read_only=True)
+    role_display = serializers.SerializerMethodField()
     
     class Meta:
         model = User
@@ -117,37 +183,36 @@ class UserProfileSerializer(serializers.ModelSerializer):
                  'role', 'role_display', 'created_at', 'updated_at', 
                  'last_login', 'is_active')
         read_only_fields = ('id', 'created_at', 'updated_at', 'last_login')
+    
+    def get_role_display(self, obj):
+        return ROLE_DISPLAY.get(obj.role, obj.role)
 
 
-class UserUpdateSerializer(serializers.ModelSerializer):
+class UserUpdateSerializer(UniqueEmailMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for updating user profile
     """
     class Meta:
         model = User
         fields = ('email', 'first_name', 'last_name', 'role')
-        
-    def validate_email(self, value):
-        user = self.instance
-        if User.objects.filter(email=value).exclude(pk=user.pk).exists():
-            raise serializers.ValidationError("User with this email already exists.")
-        return value
+        extra_kwargs = {'email': {'validators': []}}
 
 
 class ChangePasswordSerializer(serializers.Serializer):
     """
     Serializer for changing password
     """
-    old_password = serializers.CharField(write_only=True)
+    old_password = serializers.CharField(write_only=True, max_length=MAX_PASSWORD_LENGTH)
     new_password = serializers.CharField(
         write_only=True,
         min_length=8,
+        max_length=MAX_PASSWORD_LENGTH,
         validators=[validate_password]
     )
-    new_password_confirm = serializers.CharField(write_only=True)
+    new_password_confirm = serializers.CharField(write_only=True, max_length=MAX_PASSWORD_LENGTH)
     
     def validate(self, attrs):
-        if attrs['new_password'] != attrs['new_password_confirm']:
+        if attrs['new_password'] != attrs.pop('new_password_confirm'):
             raise serializers.ValidationError(
                 {"new_password": "New password fields didn't match."}
             )
@@ -0,0 +1,29 @@
+"""
+Throttle classes for LCA Tool user endpoints
+"""
+import hashlib
+
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class LoginRateThrottle(SimpleRateThrottle):
+    """
+    Limits login attempts per client IP and username, bounding how often
+    the password hasher runs for any one account from any one address.
+    Override the rate with DEFAULT_THROTTLE_RATES['login'].
+    """
+    scope = 'login'
+    default_rate = '10/min'
+
+    def get_rate(self):
+        return self.THROTTLE_RATES.get(self.scope, self.default_rate)
+
+    def get_cache_key(self, request, view):
+        data = request.data
+        username = data.get('username', '') if hasattr(data, 'get') else ''
+        # Hash the client-supplied username so it is always a safe cache key
+        digest = hashlib.sha1(str(username).lower().encode()).hexdigest()
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': f"{self.get_ident(request)}:{digest}",
+        }
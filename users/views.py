@@ -1,8 +1,13 @@
-from rest_framework import status, generics, permissions
-from rest_framework.decorators import api_view, permission_classes
+from types import SimpleNamespace
+
+from rest_framework import status, generics, permissions, serializers
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.contrib.auth import get_user_model, authenticate, login as django_login, logout as django_logout
+from django.contrib.auth import (
+    get_user_model, authenticate, login as django_login, logout as django_logout,
+    update_session_auth_hash,
+)
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
@@ -13,22 +18,59 @@ from .serializers import (
     UserLoginSerializer,         # Existing
     UserProfileSerializer,       # Existing
     UserUpdateSerializer,        # Existing
-    ChangePasswordSerializer     # Existing
+    ChangePasswordSerializer,    # Existing
+    ROLE_DISPLAY,
 )
+from .models import ADMIN, ROLE_HIERARCHY
 from .permissions import (
+    ALL_ROLES,
+    CanManageAIModels,
     CanManageUsers,
+    CanUploadDatasets,
+    CanViewReports,
     IsAdminRole,
-    IsEngineerOrAbove
+    IsEngineerOrAbove,
+    IsSelfOrAdmin,
+    METALLURGIST_OR_ADMIN_ROLES
 )
+from .pagination import UserCursorPagination
+from .throttles import LoginRateThrottle
 from .decorators import (
     api_role_required,
     AdminOnlyMixin,
-    OwnershipMixin,
     log_permission_check
 )
 
 User = get_user_model()
 
+_datetime_field = serializers.DateTimeField()
+
+
+def _serialize_user_light(user):
+    """
+    Same output as UserProfileSerializer(user).data, built directly for the
+    hot register/login/profile-update responses
+    """
+    last_login = user.last_login
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'role': user.role,
+        'role_display': ROLE_DISPLAY.get(user.role, user.role),
+        'created_at': _datetime_field.to_representation(user.created_at),
+        'updated_at': _datetime_field.to_representation(user.updated_at),
+        'last_login': _datetime_field.to_representation(last_login) if last_login else None,
+        'is_active': user.is_active,
+    }
+
+
+# Stateless permission sets for ProfileView, shared across requests
+_PROFILE_READ_PERMISSIONS = (IsAuthenticated(),)
+_PROFILE_WRITE_PERMISSIONS = (IsAuthenticated(), IsSelfOrAdmin())
+
 
 # Specification-compliant views
 class RegisterView(generics.CreateAPIView):
@@ -76,13 +118,15 @@ class ProfileView(generics.RetrieveUpdateAPIView):
     
     def get_object(self):
         """Return the current user's profile"""
-        return self.request.user
+        user = self.request.user
+        self.check_object_permissions(self.request, user)
+        return user
     
     def get_permissions(self):
         """Allow profile updates only for profile owner or admin"""
-        if self.request.method in ['PUT', 'PATCH']:
-            return [IsAuthenticated(), (OwnershipMixin() | IsAdminRole())]
-        return [IsAuthenticated()]
+        if self.request.method in ('PUT', 'PATCH'):
+            return _PROFILE_WRITE_PERMISSIONS
+        return _PROFILE_READ_PERMISSIONS
     
     @swagger_auto_schema(
         operation_description="Get current user's profile information",
@@ -125,19 +169,21 @@ class UserListView(AdminOnlyMixin, generics.ListAPIView):
     List all users (admin only)
     Specification: Only admins can view all users
     """
-    queryset = User.objects.all()
+    # Only the columns UserSerializer renders, plus the pagination cursor
+    queryset = User.objects.only('id', 'username', 'email', 'role', 'date_joined').order_by('-date_joined')
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated, CanManageUsers]
+    pagination_class = UserCursorPagination
     
     def get_queryset(self):
         """Optional: Filter users by role if query parameter provided"""
         queryset = super().get_queryset()
         role = self.request.query_params.get('role', None)
         
-        if role and role in ['engineer', 'metallurgist', 'admin']:
+        if role in ALL_ROLES:
             queryset = queryset.filter(role=role)
             
-        return queryset.order_by('-date_joined')
+        return queryset
     
     @swagger_auto_schema(
         operation_description="List all users in the system. Only accessible by admin users.",
@@ -151,10 +197,7 @@ class UserListView(AdminOnlyMixin, generics.ListAPIView):
                 type=openapi.TYPE_STRING,
                 enum=['engineer', 'metallurgist', 'admin']
             )
-        ],
-        responses={
-            200: openapi.Response('List of users', UserSerializer(many=True))
-        }
+        ]
     )
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
@@ -164,7 +207,9 @@ class UserManagementView(AdminOnlyMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Admin-only user management (get, update, delete specific user)
     """
-    queryset = User.objects.all()
+    # Columns UserSerializer renders, plus the auto_now timestamp save()
+    # maintains; a deferred instance only writes back the fields that were loaded
+    queryset = User.objects.only('id', 'username', 'email', 'role', 'updated_at')
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated, CanManageUsers]
     lookup_field = 'id'
@@ -183,8 +228,9 @@ class UserManagementView(AdminOnlyMixin, generics.RetrieveUpdateDestroyAPIView):
     
     @log_permission_check
     def delete(self, request, *args, **kwargs):
-        # Prevent admin from deleting themselves
-        if self.get_object() == request.user:
+        # Prevent admin from deleting themselves; compare the URL id directly
+        # instead of loading the object twice
+        if self.kwargs[self.lookup_field] == request.user.pk:
             return Response(
                 {'error': 'Cannot delete your own account'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -205,7 +251,7 @@ def register(request):
         user = serializer.save()
         
         # Simple response without JWT tokens
-        user_data = UserProfileSerializer(user).data
+        user_data = _serialize_user_light(user)
         user_data['permissions'] = {
             'is_admin': user.is_admin_role,
             'is_metallurgist': user.is_metallurgist,
@@ -223,12 +269,13 @@ def register(request):
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([LoginRateThrottle])
 @log_permission_check
 def login(request):
     """
     User login endpoint with simple session authentication
     """
-    serializer = UserLoginSerializer(data=request.data)
+    serializer = UserLoginSerializer(data=request.data, context={'request': request})
     if serializer.is_valid():
         user = serializer.validated_data['user']
         
@@ -236,7 +283,7 @@ def login(request):
         django_login(request, user)
         
         # Include role information for frontend
-        user_data = UserProfileSerializer(user).data
+        user_data = _serialize_user_light(user)
         user_data['permissions'] = {
             'is_admin': user.is_admin_role,
             'is_metallurgist': user.is_metallurgist,
@@ -293,10 +340,13 @@ class UserUpdateView(generics.UpdateAPIView):
     
     @log_permission_check
     def update(self, request, *args, **kwargs):
-        response = super().update(request, *args, **kwargs)
+        partial = kwargs.pop('partial', False)
+        serializer = self.get_serializer(self.get_object(), data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
         return Response({
             'message': 'Profile updated successfully',
-            'user': UserProfileSerializer(self.get_object()).data
+            'user': _serialize_user_light(serializer.instance)
         })
 
 
@@ -311,7 +361,10 @@ def change_password(request):
     if serializer.is_valid():
         user = request.user
         user.set_password(serializer.validated_data['new_password'])
-        user.save()
+        user.save(update_fields=['password', 'updated_at'])
+        # Keep the caller's session valid; token-only clients have none
+        if request.session.session_key:
+            update_session_auth_hash(request, user)
         
         return Response({'message': 'Password changed successfully'})
     
@@ -321,6 +374,68 @@ def change_password(request):
 # Legacy UserListView removed - using the role-based UserListView defined above
 
 
+def _capabilities_for(role):
+    """Role-based capability matrix reported by test_permissions"""
+    is_admin = role == ADMIN
+    is_metallurgist_or_admin = role in METALLURGIST_OR_ADMIN_ROLES
+    is_any_role = role in ALL_ROLES
+    return {
+        'admin': {
+            'manage_users': is_admin,
+            'upload_datasets': is_admin,
+            'manage_ai_models': is_admin,
+            'view_reports': is_admin,
+            'run_lca': is_admin,
+        },
+        'metallurgist': {
+            'manage_users': False,
+            'upload_datasets': is_metallurgist_or_admin,
+            'manage_ai_models': is_metallurgist_or_admin,
+            'view_reports': is_metallurgist_or_admin,
+            'run_lca': is_metallurgist_or_admin,
+        },
+        'engineer': {
+            'manage_users': False,
+            'upload_datasets': False,
+            'manage_ai_models': False,
+            'view_reports': is_any_role,
+            'run_lca': is_any_role,
+        }
+    }
+
+
+# The matrix depends only on the role, so build it once per role
+_CAPABILITY_TABLE = {role: _capabilities_for(role) for role in ROLE_HIERARCHY}
+
+# Stateless permission checks reported by test_permissions, created once
+_PERM_INSTANCES = {
+    'can_manage_users': CanManageUsers(),
+    'can_upload_datasets': CanUploadDatasets(),
+    'can_manage_ai_models': CanManageAIModels(),
+    'can_view_reports': CanViewReports(),
+    'is_admin': IsAdminRole(),
+    'is_engineer_or_above': IsEngineerOrAbove(),
+}
+
+
+def _permission_tests(request):
+    return {
+        name: permission.has_permission(request, None)
+        for name, permission in _PERM_INSTANCES.items()
+    }
+
+
+# test_permissions only serves GET, where every check above depends only on
+# the user's role, so evaluate them once per role for an authenticated GET
+_ROLE_PERMISSION_TESTS = {
+    role: _permission_tests(SimpleNamespace(
+        method='GET',
+        user=SimpleNamespace(is_authenticated=True, role=role)
+    ))
+    for role in ROLE_HIERARCHY
+}
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 @swagger_auto_schema(
@@ -373,19 +488,7 @@ def test_permissions(request):
     user = request.user
     
     # Test various permission checks
-    from .permissions import (
-        CanManageUsers, CanUploadDatasets, CanManageAIModels, 
-        CanViewReports, IsAdminRole, IsEngineerOrAbove
-    )
-    
-    permission_tests = {
-        'can_manage_users': CanManageUsers().has_permission(request, None),
-        'can_upload_datasets': CanUploadDatasets().has_permission(request, None),
-        'can_manage_ai_models': CanManageAIModels().has_permission(request, None),
-        'can_view_reports': CanViewReports().has_permission(request, None),
-        'is_admin': IsAdminRole().has_permission(request, None),
-        'is_engineer_or_above': IsEngineerOrAbove().has_permission(request, None),
-    }
+    permission_tests = _ROLE_PERMISSION_TESTS.get(user.role) or _permission_tests(request)
     
     return Response({
         'user': {
@@ -397,27 +500,5 @@ def test_permissions(request):
             'is_engineer': user.is_engineer,
         },
         'permissions': permission_tests,
-        'capabilities': {
-            'admin': {
-                'manage_users': user.role == 'admin',
-                'upload_datasets': user.role == 'admin',
-                'manage_ai_models': user.role == 'admin',
-                'view_reports': user.role == 'admin',
-                'run_lca': user.role == 'admin',
-            },
-            'metallurgist': {
-                'manage_users': False,
-                'upload_datasets': user.role in ['metallurgist', 'admin'],
-                'manage_ai_models': user.role in ['metallurgist', 'admin'],
-                'view_reports': user.role in ['metallurgist', 'admin'],
-                'run_lca': user.role in ['metallurgist', 'admin'],
-            },
-            'engineer': {
-                'manage_users': False,
-                'upload_datasets': False,
-                'manage_ai_models': False,
-                'view_reports': user.role in ['engineer', 'metallurgist', 'admin'],
-                'run_lca': user.role in ['engineer', 'metallurgist', 'admin'],
-            }
-        }
+        'capabilities': _CAPABILITY_TABLE.get(user.role) or _capabilities_for(user.role)
     })